@@ -1,14 +1,16 @@
 import inspect
-import json
 import os
 import getpass
 import sys
 import tempfile
+import threading
 import time
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
 
+from .serialization import dumps, loads
+
 if not os.getenv("GITHUB_ACTIONS"):
     CACHE_HOME_PER_PLATFORM = {
         "darwin": Path.home() / "Library" / "Caches",
@@ -31,16 +33,37 @@ class Cache:
             # create entire path if it doesn't exist
             os.makedirs(self.cache_dir, exist_ok=True)
         self.cache_filepath = self.cache_dir / "cache.json"
-        if self.cache_filepath.exists():
-            try:
-                self.data = json.load(open(self.cache_filepath))
-            except json.JSONDecodeError:
-                self.data = {}
-        else:
-            self.data = {}
+        # Whether the in-memory data was modified since it was loaded from disk
+        self.dirty = False
+        # The cache file is only read when the cache is first accessed, so that
+        # commands that don't perform any cached API call don't pay for it.
+        self._data = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def data(self):
+        if self._data is None:
+            # cached functions can be called from several threads at once
+            with self._load_lock:
+                if self._data is None:
+                    self._data = self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    def load(self):
+        try:
+            return loads(self.cache_filepath.read_bytes())
+        except (OSError, ValueError):
+            return {}
 
     def dump(self):
-        json.dump(self.data, open(self.cache_filepath, "w"), indent=2)
+        if not self.dirty:
+            return
+        self.cache_filepath.write_text(dumps(self.data, indent=True))
+        self.dirty = False
 
     def clear(self):
         self.clear_disk()
@@ -51,9 +74,11 @@ class Cache:
 
     def clear_memory(self):
         self.data = {}
+        self.dirty = False
 
     def __setitem__(self, key, value):
         self.data[key] = value
+        self.dirty = True
 
     def __getitem__(self, key):
         return self.data[key]
@@ -61,6 +86,9 @@ class Cache:
     def __contains__(self, key):
         return key in self.data
 
+    def setdefault(self, key, default):
+        return self.data.setdefault(key, default)
+
 
 cache = Cache()
 
@@ -71,30 +99,38 @@ def cached(*cached_args, **cached_kwargs):
     If a `ttl` keyword argment (of type typedelta) is passed to the decorator,
     the cached value will only be valid for the provided duration.
 
+    The decorated function also exposes `lookup` and `store` functions, giving direct
+    access to its cached values, keyed by the function arguments (`self` excluded).
+    `lookup` returns a (hit, value) tuple, as None is a valid cached value.
+
     """
 
     def decorator(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            # Check if the decorated function takes a `self` parameter, which is then omitted
-            # from the cache key, as we just care about the other arguments, not the class itself.
-            if list(inspect.signature(f).parameters.keys())[0] == "self":
-                cache_args = args[1:]
-            else:
-                cache_args = args
-            cache_key = "__".join(map(str, cache_args))
-            cache_key += "__".join([f"{k}={v}" for k, v in kwargs.items()])
-            section = f.__name__
-            if section not in cache:
-                cache[section] = {}
-            if cache_hit := cache[section].get(cache_key):
+        # Check if the decorated function takes a `self` parameter, which is then omitted
+        # from the cache key, as we just care about the other arguments, not the class itself.
+        # This is done once, as inspecting the signature is costly compared to a cache hit.
+        is_method = next(iter(inspect.signature(f).parameters), None) == "self"
+
+        def cache_key(args, kwargs):
+            key = "__".join(map(str, args))
+            key += "__".join([f"{k}={v}" for k, v in kwargs.items()])
+            return key
+
+        def lookup(*args, **kwargs):
+            # setdefault is atomic, which matters when cached functions are called
+            # from several threads at once
+            section = cache.setdefault(f.__name__, {})
+            if cache_hit := section.get(cache_key(args, kwargs)):
                 if (
                     cache_hit["valid_until"] is None
                     or cache_hit["valid_until"] > time.time()
                 ):
-                    return cache_hit["data"]
-            data = f(*args, **kwargs)
-            cache[section][cache_key] = {
+                    return True, cache_hit["data"]
+            return False, None
+
+        def store(data, *args, **kwargs):
+            section = cache.setdefault(f.__name__, {})
+            section[cache_key(args, kwargs)] = {
                 "data": data,
                 "valid_until": (
                     (datetime.now() + cached_kwargs["ttl"]).timestamp()
@@ -102,8 +138,20 @@ def cached(*cached_args, **cached_kwargs):
                     else None
                 ),
             }
+            cache.dirty = True
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            cache_args = args[1:] if is_method else args
+            hit, data = lookup(*cache_args, **kwargs)
+            if hit:
+                return data
+            data = f(*args, **kwargs)
+            store(data, *cache_args, **kwargs)
             return data
 
+        wrapper.lookup = lookup
+        wrapper.store = store
         return wrapper
 
     if cached_args and callable(cached_args[0]):
@@ -13,9 +13,9 @@ to be "real" commands or aliased commands, transparently.
 """
 
 import click
+from click.shell_completion import split_arg_string
 
-from typing import cast
-
+from phable.cli._lazy import LazyCommandGroup
 from phable.config import config
 
 
@@ -32,7 +32,7 @@ class AliasCommand(click.Command):
         )
 
     def make_context(self, info_name, args, parent=None, **extra):
-        pattern = click.parser.split_arg_string(self.target)
+        pattern = self.group.alias_args(self.alias)
         return self.group.make_context(
             info_name,
             pattern + args,
@@ -41,7 +41,7 @@ class AliasCommand(click.Command):
         )
 
 
-class AliasedCommandGroup(click.Group):
+class AliasedCommandGroup(LazyCommandGroup):
     """Custom CLI group allowing the replaement of aliases commands on the fly
 
     For example if we have the following configuraion:
@@ -56,6 +56,7 @@ class AliasedCommandGroup(click.Group):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._aliases = config.data.get("aliases", {})
+        self._split_aliases: dict[str, list[str]] = {}
 
     def make_context(self, info_name, args, parent=None, **extra):
         # First, let's parse the command and handle aliases
@@ -72,16 +73,24 @@ class AliasedCommandGroup(click.Group):
         if not args:
             return [ctx_name]
 
-        # Check if the first argument is an alias
-        if args[0] in self._aliases:
-            pattern = self._aliases[args[0]]
-            # Split the pattern and combine with remaining args
-            pattern_parts = click.parser.split_arg_string(pattern)
-            # Replace the alias with the pattern parts
+        # Check if the first argument is an alias, and if so, replace it with the
+        # arguments it expands to
+        if (pattern_parts := self.alias_args(args[0])) is not None:
             args = pattern_parts + args[1:]
 
         return [ctx_name] + args
 
+    def alias_args(self, alias: str) -> list[str] | None:
+        """Return the arguments the alias expands to, or None if it isn't an alias
+
+        The alias target is only split into arguments once.
+        """
+        if (pattern := self._aliases.get(alias)) is None:
+            return None
+        if alias not in self._split_aliases:
+            self._split_aliases[alias] = split_arg_string(pattern)
+        return self._split_aliases[alias]
+
     def list_commands(self, ctx):
         commands = set(super().list_commands(ctx))
         commands.update(self._aliases)
@@ -89,12 +98,8 @@ class AliasedCommandGroup(click.Group):
 
     def get_command(self, ctx, cmd_name):
         """Override to handle aliases in command lookup"""
-        if cmd_name in self._aliases:
-            return AliasCommand(
-                cmd_name,
-                self._aliases[cmd_name],
-                self,
-            )
+        if (target := self._aliases.get(cmd_name)) is not None:
+            return AliasCommand(cmd_name, target, self)
 
         return super().get_command(ctx, cmd_name)
 
@@ -103,8 +108,7 @@ class AliasedCommandGroup(click.Group):
         if not self._aliases:
             return
         formatter.write("\nAliases:")
-        command = cast(AliasedCommandGroup, ctx.command)
-        largest_alias = max(map(len, command.commands.keys()))
+        largest_alias = max(map(len, self.list_commands(ctx)))
         total_spacing = largest_alias + 2
         for alias_name, alias in sorted(self._aliases.items()):
             spacing = " " * (total_spacing - len(alias_name))
@@ -0,0 +1,43 @@
+"""
+Definition of a command group only importing its subcommands when they are invoked.
+
+Each subcommand lives in its own module, and building it (running all of its click
+decorators, importing its dependencies) has a cost. Instead of paying it for every
+subcommand on every invocation, the group is given a mapping of command names to the
+import path of the command object, such as `"show": "phable.cli.show:show_task"`,
+and the associated module is only imported when the command is actually looked up.
+
+See https://click.palletsprojects.com/en/stable/complex/#lazily-loading-subcommands
+
+"""
+
+import importlib
+
+import click
+
+
+class LazyCommandGroup(click.Group):
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        commands = set(super().list_commands(ctx))
+        commands.update(self._lazy_subcommands)
+        return sorted(commands)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self._lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, command_name = self._lazy_subcommands[cmd_name].split(":")
+        module = importlib.import_module(module_name)
+        command = getattr(module, command_name)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy loading of {self._lazy_subcommands[cmd_name]} failed: "
+                "it is not a click command"
+            )
+        return command
@@ -1,9 +1,15 @@
+from functools import partial
+from typing import TYPE_CHECKING
+
 import click
 
 from phable.cli.utils import VARIADIC
-from phable.phabricator import PhabricatorClient
+from phable.concurrency import map_concurrently
 from phable.task import TASK_ID
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="assign")
 @click.option(
@@ -22,7 +28,7 @@ from phable.task import TASK_ID
 @click.pass_context
 @click.pass_obj
 def assign_task(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     task_ids: list[int],
     username: str,
@@ -50,7 +56,9 @@ def assign_task(
         user = client.current_user()
     elif not (user := client.find_user_by_username(username)):
         ctx.fail(f"User {username} was not found")
-    for task_id in task_ids:
-        client.assign_task_to_user(
-            task_id=task_id, user_phid=user["phid"], secondary=secondary
-        )
+    map_concurrently(
+        partial(
+            client.assign_task_to_user, user_phid=user["phid"], secondary=secondary
+        ),
+        task_ids,
+    )
@@ -1,10 +1,12 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
 import click
 
-from phable.phabricator import PhabricatorClient
 from phable.task import TASK_ID
-from phable.utils import text_from_cli_arg_or_fs_or_editor
+from phable.utils import is_existing_path, text_from_cli_arg_or_fs_or_editor
+
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
 
 
 @click.command(name="comment")
@@ -15,7 +17,7 @@ from phable.utils import text_from_cli_arg_or_fs_or_editor
 )
 @click.argument("task-id", type=TASK_ID)
 @click.pass_obj
-def comment_on_task(client: PhabricatorClient, task_id: int, comment: Optional[str]):
+def comment_on_task(client: "PhabricatorClient", task_id: int, comment: Optional[str]):
     """Add a comment to a task
 
     \b
@@ -27,7 +29,7 @@ def comment_on_task(client: PhabricatorClient, task_id: int, comment: Optional[s
     """
     path, body = None, None
     if comment:
-        if Path(comment).exists():
+        if is_existing_path(comment):
             path = Path(comment)
         else:
             body = comment
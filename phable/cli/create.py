@@ -1,16 +1,103 @@
 import hashlib
 import re
 import tempfile
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from phable.cli.show import show_task
+from phable.concurrency import MAX_CONCURRENT_REQUESTS, map_concurrently
 from phable.config import config
-from phable.phabricator import PhabricatorClient
 from phable.task import TASK_ID
-from phable.utils import text_from_cli_arg_or_fs_or_editor
+from phable.utils import is_existing_path, text_from_cli_arg_or_fs_or_editor
+
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
+# Matches tags of the form "parent project name (subproject name)"
+TAG_WITH_SUBPROJECT_RE = re.compile(
+    r"(?P<parent>[\w\s\.-]+) \((?P<subproject>[\w\s+\.-]+)\)"
+)
+
+
+def resolve_tags(
+    client: "PhabricatorClient",
+    tags: list[str],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> list[str]:
+    """Return the phids of the projects designated by the argument tags.
+
+    A tag name can be a simple string, or "parent name (subproject name)"
+    In the case of the latter, we need to fetch details for both projects. Parent
+    projects shared by several tags are only looked up once. At most max_workers
+    projects are looked up at the same time.
+
+    :raises ValueError if a project isn't found"""
+    parsed_tags = [
+        (
+            (match.group("parent").strip(), match.group("subproject").strip())
+            if (match := TAG_WITH_SUBPROJECT_RE.fullmatch(tag))
+            else (None, tag)
+        )
+        for tag in tags
+    ]
+
+    parent_titles = list(dict.fromkeys(parent for parent, _ in parsed_tags if parent))
+    parent_projects = map_concurrently(
+        lambda title: client.find_project_by_title(title=title),
+        parent_titles,
+        max_workers=max_workers,
+    )
+    parent_phids = {}
+    for parent_title, parent_project in zip(parent_titles, parent_projects):
+        if not parent_project:
+            raise ValueError(f"Project {parent_title} not found")
+        parent_phids[parent_title] = parent_project["phid"]
+
+    def resolve_tag(parsed_tag: tuple[str | None, str]) -> str:
+        parent_title, project_title = parsed_tag
+        if parent_title:
+            project = client.find_project_by_title(
+                title=project_title, parent_phid=parent_phids[parent_title]
+            )
+        else:
+            # Simple project name with no subproject
+            project = client.find_project_by_title(title=project_title)
+        if not project:
+            raise ValueError(f"Project {project_title} not found")
+        return project["phid"]
+
+    return map_concurrently(resolve_tag, parsed_tags, max_workers=max_workers)
+
+
+def resolve_owner(client: "PhabricatorClient", owner: str) -> str:
+    """Return the phid of the argument user, or of the current user if owner is "self"
+
+    :raises ValueError if the user isn't found"""
+    if owner == "self":
+        return client.current_user()["phid"]
+    if owner_user := client.find_user_by_username(username=owner):
+        return owner_user["phid"]
+    raise ValueError(f"User {owner} not found")
+
+
+def resolve_parent_task(client: "PhabricatorClient", parent_id: int) -> list[str]:
+    return [client.show_task(parent_id, with_attachments=False)["phid"]]
+
+
+def resolve_subscribers(client: "PhabricatorClient", usernames: list[str]) -> list[str]:
+    """Return the phids of the argument users, resolved with a single API call
+
+    :raises ValueError if any user isn't found"""
+    users = client.find_users_by_usernames(usernames=list(usernames))
+    if missing_usernames := [
+        username for username in usernames if username.lower() not in users
+    ]:
+        raise ValueError(f"User(s) {', '.join(missing_usernames)} not found")
+    return [users[username.lower()]["phid"] for username in usernames]
 
 
 @click.command(name="create")
@@ -37,10 +124,16 @@ from phable.utils import text_from_cli_arg_or_fs_or_editor
 @click.option("--tags", multiple=True, help="Tags to associate to the task")
 @click.option("--cc", multiple=True, help="Subscribers to associate to the task")
 @click.option("--owner", help="The username of the task owner")
+@click.option(
+    "--show/--no-show",
+    "show",
+    default=False,
+    help="Show the created task details, instead of only printing its URL",
+)
 @click.pass_context
 @click.pass_obj
 def create_task(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     title: str,
     description: Optional[str],
@@ -50,6 +143,7 @@ def create_task(
     tags: list[str],
     cc: list[str],
     owner: Optional[str],
+    show: bool,
 ):
     """Create a new task
 
@@ -85,6 +179,9 @@ def create_task(
     \b
     # Create a task with an associated subscriber
     $ phable create --title 'A task' --cc brouberol
+    \b
+    # Create a task and show its details
+    $ phable create --title 'A task' --show
 
     """
     force_editor, should_delete_description_file = False, False
@@ -103,7 +200,7 @@ def create_task(
             force_editor = True
         else:
             ctx.fail(f"Template file {template} does not exist")
-    elif description is not None and Path(description).exists():
+    elif description is not None and is_existing_path(description):
         path = Path(description)
     else:
         path.touch()
@@ -119,59 +216,43 @@ def create_task(
         "priority": priority,
     }
 
-    tag_projects_phids = []
-    for tag in tags:
-        # The tag name can be a simple string, or "parent name (subproject name)"
-        # In the case of the latter, we need to fetch details for both projects
-        if match := re.match(
-            r"(?P<parent>[\w\s\.-]+) \((?P<subproject>[\w\s+\.-]+)\)", tag
-        ):
-            parent_title = match.group("parent").strip()
-            if parent_project := client.find_project_by_title(title=parent_title):
-                parent_project_phid = parent_project["phid"]
-            else:
-                ctx.fail(f"Project {parent_project} not found")
-            project_title = match.group("subproject").strip()
-            if project := client.find_project_by_title(
-                title=project_title, parent_phid=parent_project_phid
-            ):
-                tag_projects_phids.append(project["phid"])
-            else:
-                ctx.fail(f"Project {project_title} not found")
-
-        # Simple project name with no subproject
-        elif project := client.find_project_by_title(title=tag):
-            tag_projects_phids.append(project["phid"])
-        else:
-            ctx.fail(f"Project {tag} not found")
-
-    if tag_projects_phids:
-        task_params["projects.add"] = tag_projects_phids
-    else:
-        task_params["projects.add"] = [config.phabricator_default_project_phid]
-
+    # The tags, owner, parent task and subscribers don't depend on each other, so they
+    # are all resolved at the same time
+    other_resolvers: dict[str, Callable[[], str | list[str]]] = {}
     if owner:
-        if owner == "self":
-            task_params["owner"] = client.current_user()["phid"]
-        elif owner_user := client.find_user_by_username(username=owner):
-            task_params["owner"] = owner_user["phid"]
-        else:
-            ctx.fail(f"User {owner} not found")
-
+        other_resolvers["owner"] = partial(resolve_owner, client, owner)
     if parent_id:
-        parent = client.show_task(int(parent_id))
-        task_params["parents.set"] = [parent["phid"]]
-
-    cc_phids = []
-    for username in cc:
-        if user := client.find_user_by_username(username=username):
-            cc_phids.append(user["phid"])
-        else:
-            ctx.fail(f"User {owner} not found")
-    if cc_phids:
-        task_params["subscribers.set"] = cc_phids
+        other_resolvers["parents.set"] = partial(
+            resolve_parent_task, client, int(parent_id)
+        )
+    if cc:
+        other_resolvers["subscribers.set"] = partial(resolve_subscribers, client, cc)
+    # The tags are themselves resolved concurrently, sharing the request budget with
+    # the other resolvers, each of which performs a single request
+    resolvers: dict[str, Callable[[], str | list[str]]] = {
+        "projects.add": partial(
+            resolve_tags,
+            client,
+            tags,
+            max_workers=MAX_CONCURRENT_REQUESTS - len(other_resolvers),
+        ),
+        **other_resolvers,
+    }
+    try:
+        resolved = map_concurrently(lambda resolve: resolve(), resolvers.values())
+    except ValueError as err:
+        ctx.fail(str(err))
+    task_params |= dict(zip(resolvers, resolved))
+    if not task_params["projects.add"]:
+        task_params["projects.add"] = [config.phabricator_default_project_phid]
 
     task = client.create_or_edit_task(task_params)
-    ctx.invoke(show_task, task_id=task["result"]["object"]["id"])
+    task_id = task["result"]["object"]["id"]
+    if show:
+        ctx.invoke(show_task, task_id=task_id)
+    else:
+        # Fetching and enriching the task takes several API calls, so we only print
+        # its URL by default
+        click.echo(f"{client.base_url}/T{task_id}")
     if should_delete_description_file:
         path.unlink(missing_ok=True)
@@ -1,25 +1,28 @@
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from phable.phabricator import PhabricatorClient
 from phable.task import TASK_ID
 from phable.utils import text_from_cli_arg_or_fs_or_editor
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="edit")
 @click.argument("task-id", type=TASK_ID, required=True)
 @click.pass_context
 @click.pass_obj
-def edit_task(client: PhabricatorClient, ctx: click.Context, task_id: int):
+def edit_task(client: "PhabricatorClient", ctx: click.Context, task_id: int):
     """Edit the description text of the argument task
 
     \b
     Example:
     $ phable edit T123456
     """
-    task = client.show_task(task_id=task_id)
+    task = client.show_task(task_id=task_id, with_attachments=False)
     initial_description_filepath = Path(
         tempfile.NamedTemporaryFile(
             mode="w", encoding="utf-8", suffix=".md", delete=False
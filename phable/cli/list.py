@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
@@ -9,9 +9,11 @@ from phable.cli.utils import (
 )
 from phable.config import config
 from phable.display import TaskFormat, display_tasks
-from phable.phabricator import PhabricatorClient
 from phable.task import TaskStatus
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="list")
 @click.option(
@@ -53,7 +55,7 @@ from phable.task import TaskStatus
 @click.pass_context
 @click.pass_obj
 def list_tasks(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     columns: tuple[str],
     project: Optional[str],
@@ -3,53 +3,46 @@ import atexit
 import click
 from click import Context
 
-from phable.cache import cache
 from phable.cli._alias import AliasedCommandGroup
-from phable.cli.assign import assign_task
-from phable.cli.cache import _cache
-from phable.cli.comment import comment_on_task
-from phable.cli.config import _config
-from phable.cli.create import create_task
-from phable.cli.edit import edit_task
-from phable.cli.list import list_tasks
-from phable.cli.move import move_task
-from phable.cli.move_project_tasks import move_project_tasks
-from phable.cli.parent import parent
-from phable.cli.report import report_done_tasks
-from phable.cli.set import set_task_fields
-from phable.cli.show import show_task
-from phable.cli.subscribe import subscribe_to_task
 from phable.config import config
-from phable.phabricator import PhabricatorClient
 
 
-@click.group(cls=AliasedCommandGroup, context_settings={"show_default": True})
+@click.group(
+    cls=AliasedCommandGroup,
+    context_settings={"show_default": True},
+    lazy_subcommands={
+        "assign": "phable.cli.assign:assign_task",
+        "cache": "phable.cli.cache:_cache",
+        "comment": "phable.cli.comment:comment_on_task",
+        "config": "phable.cli.config:_config",
+        "create": "phable.cli.create:create_task",
+        "edit": "phable.cli.edit:edit_task",
+        "list": "phable.cli.list:list_tasks",
+        "move": "phable.cli.move:move_task",
+        "move-project-tasks": "phable.cli.move_project_tasks:move_project_tasks",
+        "parent": "phable.cli.parent:parent",
+        "report-done-tasks": "phable.cli.report:report_done_tasks",
+        "set": "phable.cli.set:set_task_fields",
+        "show": "phable.cli.show:show_task",
+        "subscribe": "phable.cli.subscribe:subscribe_to_task",
+    },
+)
 @click.version_option(package_name="phable-cli")
 @click.pass_context
 def cli(ctx: Context):
     """Manage Phabricator tasks from the comfort of your terminal"""
     if ctx.invoked_subcommand not in ("cache", "config"):
-        ctx.obj = PhabricatorClient(config.phabricator_url, config.phabricator_token)
-
+        # Deferred import: requests (and its urllib3/ssl dependencies) is only
+        # loaded when the invoked command actually talks to Phabricator.
+        from phable.phabricator import PhabricatorClient
 
-cli.add_command(assign_task)
-cli.add_command(_cache)
-cli.add_command(comment_on_task)
-cli.add_command(_config)
-cli.add_command(create_task)
-cli.add_command(move_task)
-cli.add_command(move_project_tasks)
-cli.add_command(report_done_tasks)
-cli.add_command(show_task)
-cli.add_command(subscribe_to_task)
-cli.add_command(list_tasks)
-cli.add_command(parent)
-cli.add_command(set_task_fields)
-cli.add_command(edit_task)
+        ctx.obj = PhabricatorClient(config.phabricator_url, config.phabricator_token)
 
 
 def runcli():
-    # Dump the in-memory cache to disk when existing the CLI
+    from phable.cache import cache
+
+    # Dump the in-memory cache to disk when exiting the CLI, if it was modified
     atexit.register(cache.dump)
     cli(max_content_width=120)
 
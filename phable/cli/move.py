@@ -1,12 +1,15 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from phable.cli.utils import VARIADIC, find_project_phid_by_title, project_phid_option
+from phable.concurrency import map_concurrently
 from phable.config import config
-from phable.phabricator import PhabricatorClient
 from phable.task import TASK_ID
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="move")
 @click.option(
@@ -28,7 +31,7 @@ from phable.task import TASK_ID
 @click.pass_context
 @click.pass_obj
 def move_task(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     project: Optional[str],
     task_ids: list[int],
@@ -55,11 +58,19 @@ def move_task(
         )
         target_column_phid = client.find_column_in_project(target_project_phid, column)
 
-        for task_id in task_ids:
+        # The status change following the move only depends on the column
+        if column.lower() in ("in progress", "needs review"):
+            update_status = client.mark_task_as_in_progress
+        elif column.lower() == "done":
+            update_status = client.mark_task_as_resolved
+        else:
+            update_status = None
+
+        def _move_task(task_id: int) -> None:
             client.move_task_to_column(task_id=task_id, column_phid=target_column_phid)
-            if column.lower() in ("in progress", "needs review"):
-                client.mark_task_as_in_progress(task_id)
-            if column.lower() == "done":
-                client.mark_task_as_resolved(task_id)
+            if update_status:
+                update_status(task_id)
+
+        map_concurrently(_move_task, task_ids)
     except ValueError as ve:
         ctx.fail(str(ve))
@@ -1,12 +1,14 @@
 from collections import defaultdict
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional, Any
 
 import click
 from click import Context
 
 from phable.cli.utils import find_project_phid_by_title, project_phid_option
 from phable.config import config
-from phable.phabricator import PhabricatorClient
+
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
 
 
 @click.command(name="move-project-tasks")
@@ -34,7 +36,7 @@ from phable.phabricator import PhabricatorClient
 @click.pass_context
 @click.pass_obj
 def move_project_tasks(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     project: Optional[str],
     source: Optional[str],
@@ -1,9 +1,35 @@
+from functools import partial
+from typing import TYPE_CHECKING, Literal
+
 import click
 
 from phable.cli.utils import VARIADIC
-from phable.phabricator import PhabricatorClient
+from phable.concurrency import map_concurrently
 from phable.task import TASK_ID
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
+
+def _edit_task_parents(
+    client: "PhabricatorClient",
+    task_ids: list[int],
+    parent_ids: list[int],
+    action: Literal["add", "remove", "set"],
+):
+    parent_phids = [
+        parent_task["phid"]
+        for parent_task in map_concurrently(
+            partial(client.show_task, with_attachments=False), parent_ids
+        )
+    ]
+    map_concurrently(
+        partial(
+            client.edit_parent_tasks, parent_task_phids=parent_phids, action=action
+        ),
+        task_ids,
+    )
+
 
 @click.group()
 def parent():
@@ -15,7 +41,7 @@ def parent():
 @click.option("--parent-ids", type=TASK_ID, help="ID(s) of parent task", multiple=True)
 @click.pass_obj
 def set_task_parent(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     task_ids: list[int],
     parent_ids: list[int],
 ):
@@ -35,13 +61,7 @@ def set_task_parent(
     \b
 
     """
-    parent_phids = []
-    for parent_id in parent_ids:
-        parent_task = client.show_task(task_id=parent_id)
-        parent_phids.append(parent_task["phid"])
-
-    for task_id in task_ids:
-        client.edit_parent_tasks(task_id, parent_task_phids=parent_phids, action="set")
+    _edit_task_parents(client, task_ids, parent_ids, action="set")
 
 
 @parent.command(name="add")
@@ -49,7 +69,7 @@ def set_task_parent(
 @click.option("--parent-ids", type=TASK_ID, help="ID(s) of parent task", multiple=True)
 @click.pass_obj
 def add_task_parent(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     task_ids: list[int],
     parent_ids: list[int],
 ):
@@ -69,13 +89,7 @@ def add_task_parent(
     \b
 
     """
-    parent_phids = []
-    for parent_id in parent_ids:
-        parent_task = client.show_task(task_id=parent_id)
-        parent_phids.append(parent_task["phid"])
-
-    for task_id in task_ids:
-        client.edit_parent_tasks(task_id, parent_task_phids=parent_phids, action="add")
+    _edit_task_parents(client, task_ids, parent_ids, action="add")
 
 
 @parent.command(name="remove")
@@ -83,7 +97,7 @@ def add_task_parent(
 @click.option("--parent-ids", type=TASK_ID, help="ID(s) of parent task", multiple=True)
 @click.pass_obj
 def remove_task_parent(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     task_ids: list[int],
     parent_ids: list[int],
 ):
@@ -103,12 +117,4 @@ def remove_task_parent(
     \b
 
     """
-    parent_phids = []
-    for parent_id in parent_ids:
-        parent_task = client.show_task(task_id=parent_id)
-        parent_phids.append(parent_task["phid"])
-
-    for task_id in task_ids:
-        client.edit_parent_tasks(
-            task_id, parent_task_phids=parent_phids, action="remove"
-        )
+    _edit_task_parents(client, task_ids, parent_ids, action="remove")
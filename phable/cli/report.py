@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
@@ -9,7 +9,9 @@ from phable.cli.utils import (
 )
 from phable.config import config
 from phable.display import TaskFormat, display_tasks
-from phable.phabricator import PhabricatorClient
+
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
 
 
 @click.command(name="report-done-tasks")
@@ -43,7 +45,7 @@ from phable.phabricator import PhabricatorClient
 @click.pass_context
 @click.pass_obj
 def report_done_tasks(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     project: Optional[str],
     milestone: bool,
@@ -67,10 +69,9 @@ def report_done_tasks(
     )
     tasks = client.find_tasks(column_phids=[column_source_phid])
 
-    enriched_tasks = []
-    for task in tasks:
-        task = client.enrich_task(task)
-        enriched_tasks.append(task)
-        client.move_task_to_column(task["id"], column_destination_phid)
+    enriched_tasks = [client.enrich_task(task) for task in tasks]
+    client.move_tasks_to_column(
+        [task["id"] for task in enriched_tasks], column_destination_phid
+    )
 
     display_tasks(enriched_tasks, format=format)
@@ -1,11 +1,14 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
 from phable.cli.utils import VARIADIC, choices_from_enum
-from phable.phabricator import PhabricatorClient
+from phable.concurrency import map_concurrently
 from phable.task import TASK_ID, TaskPriority, TaskStatus
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="set")
 @click.option(
@@ -24,7 +27,7 @@ from phable.task import TASK_ID, TaskPriority, TaskStatus
 @click.pass_context
 @click.pass_obj
 def set_task_fields(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     ctx: click.Context,
     task_ids: list[int],
     priority: Optional[str],
@@ -62,5 +65,7 @@ def set_task_fields(
         params["status"] = status
     if tag_phids:
         params["projects.add"] = tag_phids
-    for task_id in task_ids:
-        client.create_or_edit_task(task_id=task_id, params=params)
+    map_concurrently(
+        lambda task_id: client.create_or_edit_task(task_id=task_id, params=params),
+        task_ids,
+    )
@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 import click
 
 from phable.cli.utils import choices_from_enum
 from phable.display import TaskFormat, display_task
-from phable.phabricator import PhabricatorClient
-from phable.task import TASK_ID, Task
+from phable.task import TASK_ID
+
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
 
 
 @click.command(name="show")
@@ -17,7 +21,7 @@ from phable.task import TASK_ID, Task
 @click.argument("task-id", type=TASK_ID, required=True)
 @click.pass_obj
 def show_task(
-    client: PhabricatorClient,
+    client: "PhabricatorClient",
     task_id: int,
     format: str = TaskFormat.plain,
     show_full: bool = False,
@@ -42,4 +46,4 @@ def show_task(
         )
         display_task(task=task, format=format)
     else:
-        click.echo(f"Task {Task.from_int(task_id)} not found", err=True)
+        click.echo(f"Task T{task_id} not found", err=True)
@@ -1,16 +1,22 @@
+from functools import partial
+from typing import TYPE_CHECKING
+
 import click
 
 from phable.cli.utils import VARIADIC
-from phable.phabricator import PhabricatorClient
+from phable.concurrency import map_concurrently
 from phable.task import TASK_ID
 
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 @click.command(name="subscribe")
 @click.argument("task-ids", type=TASK_ID, nargs=VARIADIC, required=True)
 @click.pass_context
 @click.pass_obj
 def subscribe_to_task(
-    client: PhabricatorClient, ctx: click.Context, task_ids: list[int]
+    client: "PhabricatorClient", ctx: click.Context, task_ids: list[int]
 ):
     """Subscribe to one or multiple task ids
 
@@ -21,7 +27,9 @@ def subscribe_to_task(
 
     """
     if user := client.current_user():
-        for task_id in task_ids:
-            client.add_user_to_task_subscribers(task_id=task_id, user_phid=user["phid"])
+        map_concurrently(
+            partial(client.add_user_to_task_subscribers, user_phid=user["phid"]),
+            task_ids,
+        )
     else:
         ctx.fail("Current user was not found")
@@ -1,9 +1,12 @@
 from enum import StrEnum
-from typing import Optional
+from functools import cache
+from typing import TYPE_CHECKING, Optional
 
 import click
 
-from phable.phabricator import PhabricatorClient
+if TYPE_CHECKING:
+    from phable.phabricator import PhabricatorClient
+
 
 VARIADIC = -1
 
@@ -20,7 +23,7 @@ project_phid_option = click.option(
 
 
 def find_project_phid_by_title(
-    client: PhabricatorClient, ctx: click.Context, project: Optional[str]
+    client: "PhabricatorClient", ctx: click.Context, project: Optional[str]
 ) -> Optional[str]:
     if project:
         project_data = client.find_project_by_title(project)
@@ -30,5 +33,6 @@ def find_project_phid_by_title(
     return None
 
 
+@cache
 def choices_from_enum(EnumCls: type[StrEnum]) -> click.Choice:
     return click.Choice(EnumCls._member_names_, case_sensitive=False)
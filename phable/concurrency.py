@@ -0,0 +1,29 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of API requests sent to Phabricator at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> list[R]:
+    """Call func on each item from a thread pool, and return the results in order.
+
+    This is meant to run independent API calls at the same time, as they spend most
+    of their time waiting on the network. The first exception raised by a call is
+    re-raised once all calls are done.
+
+    """
+    items = list(items)
+    # No need to pay for a thread pool when there is nothing to run concurrently
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
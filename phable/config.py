@@ -1,7 +1,8 @@
 import getpass
 import os
+import pickle
 import sys
-from configparser import ConfigParser
+import tempfile
 from dataclasses import dataclass, field
 from functools import cache, partial
 from pathlib import Path
@@ -36,25 +37,66 @@ def field_with_default_from_config_then_env(
     return field(default_factory=default_factory)
 
 
+def parsed_config_filepath() -> Path:
+    return config_filepath.with_name(f"{config_filepath.name}.cache.pkl")
+
+
+def read_parsed_config(config_stat: os.stat_result) -> dict | None:
+    """Return the previously parsed config, if the config file hasn't changed since."""
+    try:
+        mtime_ns, size, data = pickle.loads(parsed_config_filepath().read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        return None
+    if (mtime_ns, size) != (config_stat.st_mtime_ns, config_stat.st_size):
+        return None
+    return data
+
+
+def write_parsed_config(config_stat: os.stat_result, data: dict) -> None:
+    """Save the parsed config next to the config file, keyed by the config mtime and size.
+
+    The file is written atomically, and is only readable by the current user, as the
+    config can contain the API token.
+    """
+    tmpfile_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=config_filepath.parent, delete=False
+        ) as tmpfile:
+            tmpfile_path = Path(tmpfile.name)
+            pickle.dump((config_stat.st_mtime_ns, config_stat.st_size, data), tmpfile)
+        os.replace(tmpfile_path, parsed_config_filepath())
+    except OSError:
+        # Don't leave a copy of the API token behind
+        if tmpfile_path is not None:
+            tmpfile_path.unlink(missing_ok=True)
+
+
 @cache
 def read_config() -> dict:
     if not config_filepath.parent.exists():
         config_filepath.parent.mkdir()
     if not config_filepath.exists():
         return {}
-    else:
-        config = ConfigParser()
-        try:
-            config.read(config_filepath)
-        except Exception:
-            _warnings.append(
-                f"Configuration file {config_filepath} is invalid. Skipping parsing."
-            )
-            return {}
-        else:
-            return {
-                section: dict(config.items(section)) for section in config.sections()
-            }
+
+    config_stat = config_filepath.stat()
+    if (data := read_parsed_config(config_stat)) is not None:
+        return data
+
+    # Only imported when the config file actually needs to be parsed
+    from configparser import ConfigParser
+
+    config = ConfigParser()
+    try:
+        config.read(config_filepath)
+    except Exception:
+        _warnings.append(
+            f"Configuration file {config_filepath} is invalid. Skipping parsing."
+        )
+        return {}
+    data = {section: dict(config.items(section)) for section in config.sections()}
+    write_parsed_config(config_stat, data)
+    return data
 
 
 @dataclass()
@@ -1,8 +1,14 @@
-import json
+import sys
 from collections.abc import Callable
 from enum import StrEnum
 
-from .task import Task
+from .serialization import dumps_bytes
+
+# Printed after each task of a plain task list
+_TASK_SEPARATOR = "=" * 50
+# Checkbox printed in front of each subtask, depending on its status
+_STATUS_GLYPH = {"resolved": "[x]"}
+_STATUS_GLYPH_DEFAULT = "[ ]"
 
 
 class TaskFormat(StrEnum):
@@ -19,15 +25,33 @@ def display_tasks(
     tasks: list[dict],
     format: TaskFormat,
 ) -> None:
-    if len(tasks) == 1:
-        return display_task(tasks[0], format=format)
-    get_printer(format).print_list(tasks)
+    printer = get_printer(format)
+    # JSON task lists are always printed as a list, so that the output shape doesn't
+    # depend on the number of tasks
+    if len(tasks) == 1 and format != TaskFormat.json:
+        return printer.print(tasks[0])
+    printer.print_list(tasks)
 
 
 def display_task(task: dict, format: str) -> None:
     get_printer(format).print(task)
 
 
+def write_bytes(data: bytes) -> None:
+    """Write the argument bytes and a newline to stdout, in a single write.
+
+    Bytes are written as-is to the binary stdout stream, after any pending text output,
+    instead of being decoded to text only to be encoded back right away.
+    """
+    if (stdout := getattr(sys.stdout, "buffer", None)) is None:
+        # stdout was replaced by a text-only stream
+        print(data.decode())
+        return
+    sys.stdout.flush()
+    stdout.write(data + b"\n")
+    stdout.flush()
+
+
 class TaskPrinter:
     def __init__(self, printer: Callable):
         self._printer = printer
@@ -39,121 +63,150 @@ class TaskPrinter:
         for task in tasks:
             self.print(task)
 
-    def title(self, task: dict) -> str:
-        return f"{Task.from_int(task['id'])} {task['fields']['name']}"
 
-    def status(self, task: dict) -> str:
-        return f"({task['fields']['status']['name']})"
+class JsonTaskPrinter(TaskPrinter):
+    """Print tasks as JSON documents, serialized to bytes.
 
+    The printer must accept bytes, such as write_bytes.
+    """
 
-class JsonTaskPrinter(TaskPrinter):
     def print(self, task: dict) -> None:
-        self._printer(json.dumps(task, indent=2))
+        self._printer(dumps_bytes(task, indent=True))
 
     def print_list(self, tasks: list[dict]) -> None:
-        self._printer(json.dumps(tasks, indent=2))
+        self._printer(dumps_bytes(tasks, indent=True))
 
 
-class MarkdownTaskPrinter(TaskPrinter):
-    def print(self, task: dict) -> None:
-        self._printer(f"* [{self.title(task)}]({task['url']}) {self.status(task)}")
+class TextTaskPrinter(TaskPrinter):
+    """Print tasks formatted as text, one task after the other.
 
+    Subclasses implement format, and can override format_list_item to change how
+    a task is rendered within a list.
+    """
 
-class WikitextTaskPrinter(TaskPrinter):
-    def print(self, task: dict) -> None:
-        self._printer(f"* [{task['url']} {self.title(task)}] {self.status(task)}")
-
+    def format(self, task: dict) -> str:
+        raise NotImplementedError
 
-class HtmlTaskPrinter(TaskPrinter):
     def print(self, task: dict) -> None:
-        self._printer(
-            f"<a href={task['url']}>{self.title(task)}</a> {self.status(task)}"
-        )
+        self._printer(self.format(task))
+
+    def format_list_item(self, task: dict) -> str:
+        return self.format(task)
 
     def print_list(self, tasks: list[dict]) -> None:
-        for task in tasks:
-            self._printer(
-                f"<li><a href={task['url']}>{self.title(task)}</a> {self.status(task)}</li>"
-            )
+        # All tasks are written at once, instead of one by one
+        if tasks:
+            self._printer("\n".join(map(self.format_list_item, tasks)))
 
+    def title(self, task: dict) -> str:
+        return f"T{task['id']} {task['fields']['name']}"
 
-class PlainTaskPrinter(TaskPrinter):
-    def print(self, task: dict) -> None:
+    def status(self, task: dict) -> str:
+        return f"({task['fields']['status']['name']})"
+
+
+class MarkdownTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
+        return f"* [{self.title(task)}]({task['url']}) {self.status(task)}"
+
+
+class WikitextTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
+        return f"* [{task['url']} {self.title(task)}] {self.status(task)}"
+
+
+class HtmlTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
+        return f"<a href={task['url']}>{self.title(task)}</a> {self.status(task)}"
+
+    def format_list_item(self, task: dict) -> str:
+        return f"<li>{self.format(task)}</li>"
+
+
+class PlainTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
         parent_task = task.get("parent", {})
         if parent_task:
             parent_str = self.title(parent_task)
         else:
             parent_str = ""
-        print(f"URL: {task['url']}")
-        print(f"Task: {Task.from_int(task['id'])}")
-        print(f"Title: {task['fields']['name']}")
+        fields = task["fields"]
+        lines = [
+            f"URL: {task['url']}",
+            f"Task: T{task['id']}",
+            f"Title: {fields['name']}",
+        ]
         if task.get("author"):
-            print(f"Author: {task['author']['fields']['username']}")
+            lines.append(f"Author: {task['author']['fields']['username']}")
         if task.get("owner"):
-            print(f"Owner: {task['owner']}")
+            lines.append(f"Owner: {task['owner']}")
         if task.get("tags"):
-            print(f"Tags: {', '.join(task['tags'])}")
-        print(f"Status: {task['fields']['status']['name']}")
-        print(f"Priority: {task['fields']['priority']['name']}")
-        print(f"Description: {task['fields']['description']['raw']}")
-        print(f"Parent: {parent_str}")
-        print("Subtasks:")
+            lines.append(f"Tags: {', '.join(task['tags'])}")
+        lines += [
+            f"Status: {fields['status']['name']}",
+            f"Priority: {fields['priority']['name']}",
+            f"Description: {fields['description']['raw']}",
+            f"Parent: {parent_str}",
+            "Subtasks:",
+        ]
         if task.get("subtasks"):
             for subtask in task["subtasks"]:
-                status = f"{'[x]' if subtask['fields']['status']['value'] == 'resolved' else '[ ]'}"
-                print(
-                    f"{status} - {Task.from_int(subtask['id'])} - @{subtask['owner']:<10} - {subtask['fields']['name']}"
+                subtask_fields = subtask["fields"]
+                status = _STATUS_GLYPH.get(
+                    subtask_fields["status"]["value"], _STATUS_GLYPH_DEFAULT
+                )
+                lines.append(
+                    f"{status} - T{subtask['id']} - @{subtask['owner'].ljust(10)} - {subtask_fields['name']}"
                 )
         if "comments" in task:
-            print("Comments:")
+            lines.append("Comments:")
             if task["comments"]:
                 for i, comment in enumerate(reversed(task["comments"]), start=1):
-                    print(
-                        f"--- Comment #{i} by {comment['author']} - {comment['modified'].isoformat()} ---"
-                    )
-                    print(comment["comment"].rstrip(), end="\n\n")
+                    lines += [
+                        f"--- Comment #{i} by {comment['author']} - {comment['modified'].isoformat()} ---",
+                        comment["comment"].rstrip(),
+                        "",
+                    ]
             else:
-                print("(none)")
-
-    def print_list(self, tasks: list[dict]) -> None:
-        for task in tasks:
-            self.print(task)
-            self._printer("=" * 50)
+                lines.append("(none)")
+        return "\n".join(lines)
+
+    def format_list_item(self, task: dict) -> str:
+        return f"{self.format(task)}\n{_TASK_SEPARATOR}"
+
+
+class OneLineTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
+        fields = task["fields"]
+        return " ".join(
+            [
+                f"T{task['id']}",
+                fields["status"]["name"].ljust(12),
+                fields["priority"]["name"].ljust(12),
+                fields["name"],
+            ]
+        )
 
 
-class OneLineTaskPrinter(TaskPrinter):
-    def print(self, task: dict) -> None:
-        self._printer(
-            " ".join(
-                [
-                    f"{Task.from_int(task['id'])}",
-                    f"{task['fields']['status']['name']:<12}",
-                    f"{task['fields']['priority']['name']:<12}",
-                    task["fields"]["name"],
-                ]
-            )
-        )
+class IdsTaskPrinter(TextTaskPrinter):
+    def format(self, task: dict) -> str:
+        return f"T{task['id']}"
 
 
-class IdsTaskPrinter(TaskPrinter):
-    def print(self, task: dict) -> None:
-        self._printer(f"{Task.from_int(task['id'])}")
+_PRINTERS: dict[str, type[TaskPrinter]] = {
+    TaskFormat.plain: PlainTaskPrinter,
+    TaskFormat.json: JsonTaskPrinter,
+    TaskFormat.html: HtmlTaskPrinter,
+    TaskFormat.markdown: MarkdownTaskPrinter,
+    TaskFormat.wikitext: WikitextTaskPrinter,
+    TaskFormat.oneline: OneLineTaskPrinter,
+    TaskFormat.ids: IdsTaskPrinter,
+}
 
 
 def get_printer(format: str) -> TaskPrinter:
-    if format == TaskFormat.plain:
-        return PlainTaskPrinter(print)
-    elif format == TaskFormat.json:
-        return JsonTaskPrinter(print)
-    elif format == TaskFormat.html:
-        return HtmlTaskPrinter(print)
-    elif format == TaskFormat.markdown:
-        return MarkdownTaskPrinter(print)
-    elif format == TaskFormat.wikitext:
-        return WikitextTaskPrinter(print)
-    elif format == TaskFormat.oneline:
-        return OneLineTaskPrinter(print)
-    elif format == TaskFormat.ids:
-        return IdsTaskPrinter(print)
-    else:
-        raise ValueError(f"Unknown format: {format}")
+    try:
+        printer_class = _PRINTERS[format]
+    except KeyError:
+        raise ValueError(f"Unknown format: {format}") from None
+    return printer_class(write_bytes if printer_class is JsonTaskPrinter else print)
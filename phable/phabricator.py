@@ -1,25 +1,20 @@
 from datetime import UTC, datetime, timedelta
 from importlib.metadata import version
 from typing import Any, Literal, Optional, TypeVar
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .cache import cached
+from .concurrency import MAX_CONCURRENT_REQUESTS, map_concurrently
+from .serialization import loads
 from .task import TaskStatus
 
 T = TypeVar("T")
 
 
-class Task(int):
-    @classmethod
-    def from_str(cls, value: str) -> int:
-        return int(value.lstrip("T"))
-
-    @classmethod
-    def from_int(cls, value: int) -> str:
-        return f"T{value}"
-
-
 class PhabricatorClient:
     """Phabricator API HTTP client.
 
@@ -30,7 +25,32 @@ class PhabricatorClient:
     def __init__(self, base_url, token):
         self.base_url = base_url.rstrip("/")
         self.token = token
+        # The credentials and output format are sent with every request, so we only
+        # url-encode them once.
+        self.encoded_base_params = urlencode({"api.token": token, "output": "json"})
         self.session = requests.Session()
+        # Keep as many connections alive as we can have concurrent requests, so that
+        # every concurrent API call can reuse an already established TLS connection.
+        # Conduit calls are all POST requests, some of which edit tasks, so we only
+        # retry them when we know the server did not process them: when the
+        # connection could not be established, or when the request was rejected
+        # because of rate limiting or maintenance.
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        self.session.mount(
+            self.base_url,
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                max_retries=retries,
+            ),
+        )
         self.timeout = 5
         self.base_headers = {
             "User-Agent": f"Phable/{version('phable_cli')} (https://pypi.org/project/phable-cli)",
@@ -45,61 +65,77 @@ class PhabricatorClient:
     def _make_request(
         self,
         path: str,
-        params: dict[str, Any] | None = None,
+        params: dict[str, Any] | list[tuple[str, Any]] | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Helper method to make API requests"""
-        headers = headers or {}
-        headers |= self.base_headers
-        params = params or {}
-        data = {}
-        data["api.token"] = self.token
-        data["output"] = "json"
-        data |= params
+        headers = {**(headers or {}), **self.base_headers}
+        data = self.encoded_base_params
+        if params:
+            data += "&" + urlencode(params, doseq=True)
 
         try:
             response = self.session.post(
                 f"{self.base_url}/api/{path}",
                 headers=headers,
-                data=data,
+                data=data.encode(),
                 timeout=self.timeout,
             )
 
             response.raise_for_status()
-            resp_json = response.json()
+            resp_json = loads(response.content)
             if resp_json["error_code"]:
                 raise Exception(f"API request failed: {resp_json}")
-            return response.json()
-        except requests.RequestException as e:
+            return resp_json
+        except (requests.RequestException, ValueError) as e:
             raise Exception(f"API request failed: {str(e)}")
 
+    def _search(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the results of a *.search API endpoint, across all result pages"""
+        params = dict(params or {})
+        results = []
+        while True:
+            result = self._make_request(path, params=params)["result"]
+            results.extend(result["data"])
+            if not (after := (result.get("cursor") or {}).get("after")):
+                return results
+            params["after"] = after
+
     def create_or_edit_task(
         self, params: dict[str, Any], task_id: Optional[int] = None
     ) -> dict[str, Any]:
         """Create or edit (if a task_id is provided) a Maniphest task."""
-        raw_params = {}
+        raw_params: list[tuple[str, Any]] = []
         for i, (key, value) in enumerate(params.items()):
-            raw_params[f"transactions[{i}][type]"] = key
+            raw_params.append((f"transactions[{i}][type]", key))
             if isinstance(value, list):
-                for j, subvalue in enumerate(value):
-                    raw_params[f"transactions[{i}][value][{j}]"] = subvalue
+                raw_params.extend(
+                    (f"transactions[{i}][value][{j}]", subvalue)
+                    for j, subvalue in enumerate(value)
+                )
             else:
-                raw_params[f"transactions[{i}][value]"] = value
+                raw_params.append((f"transactions[{i}][value]", value))
         if task_id:
-            raw_params["objectIdentifier"] = str(task_id)
+            raw_params.append(("objectIdentifier", str(task_id)))
         return self._make_request("maniphest.edit", params=raw_params)
 
-    def show_task(self, task_id: int) -> dict[str, Any]:
-        """Show a Maniphest task"""
-        return self._make_request(
-            "maniphest.search",
-            params={
-                "constraints[ids][0]": task_id,
+    def show_task(self, task_id: int, with_attachments: bool = True) -> dict[str, Any]:
+        """Show a Maniphest task
+
+        The task subscribers, projects and columns are only requested if
+        with_attachments is True.
+        """
+        params: dict[str, Any] = {"constraints[ids][0]": task_id}
+        if with_attachments:
+            params |= {
                 "attachments[subscribers]": "true",
                 "attachments[projects]": "true",
                 "attachments[columns]": "true",
-            },
-        )["result"]["data"][0]
+            }
+        tasks = self._make_request("maniphest.search", params=params)["result"]["data"]
+        return tasks[0]
 
     def enrich_task(
         self,
@@ -119,51 +155,61 @@ class PhabricatorClient:
         * subtasks
         * parent tasks
         """
-        task["url"] = f"{self.base_url}/{Task.from_int(task['id'])}"
+        task["url"] = f"{self.base_url}/T{task['id']}"
 
+        enrichments = []
         if with_author_owner:
-            self.enrich_task_with_author_owner(task)
+            enrichments.append(self.enrich_task_with_author_owner)
         if with_tags:
-            self.enrich_task_with_tags(task)
+            enrichments.append(self.enrich_task_with_tags)
         if with_subtasks:
-            self.enrich_task_with_subtasks(task)
+            enrichments.append(self.enrich_task_with_subtasks)
         if with_parent:
-            self.enrich_task_with_parent(task)
+            enrichments.append(self.enrich_task_with_parent)
         if with_comments:
-            self.enrich_task_with_comments(task)
+            enrichments.append(self.enrich_task_with_comments)
+
+        # Each enrichment performs its own API calls and sets a different key of the
+        # task, so they can all run at the same time.
+        map_concurrently(lambda enrich: enrich(task), enrichments)
         return task
 
     def enrich_task_with_author_owner(self, task: dict[str, Any]) -> None:
-        task["author"] = self.show_user(phid=task["fields"]["authorPHID"])
+        author_id, owner_id = task["fields"]["authorPHID"], task["fields"]["ownerPHID"]
+        users = self.show_users(phids=sorted({author_id, owner_id} - {None}))
+        task["author"] = users.get(author_id)
         owner_username = "Unassigned"
-        if owner_id := task["fields"]["ownerPHID"]:
-            if owner := self.show_user(phid=owner_id):
-                owner_username = owner["fields"]["username"]
+        if owner_id and (owner := users.get(owner_id)):
+            owner_username = owner["fields"]["username"]
         task["owner"] = owner_username
 
     def enrich_task_with_tags(self, task: dict[str, Any]) -> None:
+        tags = []
         if project_ids := task["attachments"]["projects"]["projectPHIDs"]:
-            tags = [
-                (
-                    f"{project['fields']['parent']['name']} - {project['fields']['name']}"
-                    if project["fields"]["parent"]
-                    else project["fields"]["name"]
-                )
-                for project in self.show_projects(phids=project_ids)
-            ]
-        else:
-            tags = []
+            for project in self.show_projects(phids=project_ids):
+                project_fields = project["fields"]
+                if parent := project_fields["parent"]:
+                    tags.append(f"{parent['name']} - {project_fields['name']}")
+                else:
+                    tags.append(project_fields["name"])
         task["tags"] = tags
 
     def enrich_task_with_subtasks(self, task: dict[str, Any]) -> None:
         subtasks = self.find_subtasks(parent_id=task["id"])
         if not subtasks:
             subtasks = []
+        owner_phids = sorted(
+            {
+                owner_phid
+                for subtask in subtasks
+                if (owner_phid := subtask["fields"]["ownerPHID"])
+            }
+        )
+        owners = self.show_users(phids=owner_phids) if owner_phids else {}
         for subtask in subtasks:
             owner_username = ""
-            if subtask_owner_id := subtask["fields"]["ownerPHID"]:
-                if owner := self.show_user(subtask_owner_id):
-                    owner_username = owner["fields"]["username"]
+            if owner := owners.get(subtask["fields"]["ownerPHID"]):
+                owner_username = owner["fields"]["username"]
             subtask["owner"] = owner_username
         task["subtasks"] = subtasks
 
@@ -173,28 +219,33 @@ class PhabricatorClient:
 
     def enrich_task_with_comments(self, task: dict[str, Any]) -> None:
         transactions = self.find_task_transactions(task_id=task["id"])
+        comments_data = [
+            comment_data
+            for transaction in transactions
+            for comment_data in transaction.get("comments", [])
+            if not comment_data.get("removed")
+            and comment_data.get("content", {}).get("raw")
+        ]
+        # Resolve all comment authors with a single API call
+        author_phids = sorted(
+            {comment_data["authorPHID"] for comment_data in comments_data}
+        )
+        authors = self.show_users(phids=author_phids) if author_phids else {}
         task["comments"] = []
-        for transaction in transactions:
-            for comment_data in transaction.get("comments", []):
-                if comment_data.get("removed") or not comment_data.get(
-                    "content", {}
-                ).get("raw"):
-                    continue
-                comment = {
-                    "author": None,
-                    "comment": comment_data["content"]["raw"],
-                    "modified": datetime.fromtimestamp(
-                        comment_data["dateModified"], UTC
-                    ),
-                }
-                if author := self.show_user(phid=comment_data["authorPHID"]):
-                    comment["author"] = author["fields"]["username"]
-                task["comments"].append(comment)
+        for comment_data in comments_data:
+            comment = {
+                "author": None,
+                "comment": comment_data["content"]["raw"],
+                "modified": datetime.fromtimestamp(comment_data["dateModified"], UTC),
+            }
+            if author := authors.get(comment_data["authorPHID"]):
+                comment["author"] = author["fields"]["username"]
+            task["comments"].append(comment)
 
     def find_task_transactions(self, task_id: int) -> list[dict[str, Any]]:
         return self._make_request(
             "transaction.search",
-            params={"objectIdentifier": Task.from_int(task_id)},
+            params={"objectIdentifier": f"T{task_id}"},
         )["result"]["data"]
 
     def find_tasks(
@@ -210,24 +261,27 @@ class PhabricatorClient:
             "attachments[projects]": "true",
             "attachments[columns]": "true",
         }
-        column_phids = column_phids or []
-        for i, column_phid in enumerate(column_phids):
-            params[f"constraints[columnPHIDs][{i}]"] = column_phid
-        for i, status_name in enumerate(status or []):
-            params[f"constraints[statuses][{i}]"] = status_name
+        params |= {
+            f"constraints[columnPHIDs][{i}]": column_phid
+            for i, column_phid in enumerate(column_phids or [])
+        }
+        params |= {
+            f"constraints[statuses][{i}]": status_name
+            for i, status_name in enumerate(status or [])
+        }
         if owner_phid:
             params["constraints[assigned][0]"] = owner_phid
         elif backup_owner_phid:
             params["constraints[custom.train.backup][0]"] = backup_owner_phid
         if project_phid:
             params["constraints[projects][0]"] = project_phid
-        return self._make_request("maniphest.search", params=params)["result"]["data"]
+        return self._search("maniphest.search", params=params)
 
     def find_subtasks(self, parent_id: int) -> list[dict[str, Any]]:
         """Return details of all Maniphest subtasks of the provided task id"""
-        return self._make_request(
+        return self._search(
             "maniphest.search", params={"constraints[parentIDs][0]": parent_id}
-        )["result"]["data"]
+        )
 
     @cached
     def find_parent_task(self, subtask_id: int) -> Optional[dict[str, Any]]:
@@ -242,6 +296,18 @@ class PhabricatorClient:
         """Move the argument task to column of associated column id"""
         return self.create_or_edit_task(task_id=task_id, params={"column": column_phid})
 
+    def move_tasks_to_column(
+        self, task_ids: list[int], column_phid: str
+    ) -> list[dict[str, Any]]:
+        """Move all argument tasks to column of associated column id
+
+        Conduit has no bulk edit endpoint, so the tasks are moved with concurrent
+        requests instead.
+        """
+        return map_concurrently(
+            lambda task_id: self.move_task_to_column(task_id, column_phid), task_ids
+        )
+
     def set_task_status(self, task_id: int, status: TaskStatus) -> dict[str, Any]:
         return self.create_or_edit_task(task_id=task_id, params={"status": status})
 
@@ -269,12 +335,40 @@ class PhabricatorClient:
         )["result"]["data"]
         return self._first(user)
 
+    def show_users(self, phids: list[str]) -> dict[str, dict[str, Any]]:
+        """Return the details of the users with the provided phids, indexed by phid
+
+        Users are looked up in the show_user cache first, and the missing ones are then
+        fetched with a single search, across all result pages, and cached individually.
+
+        Phids that don't match any user are absent from the returned dict.
+        """
+        users, missing_phids = {}, []
+        for phid in phids:
+            hit, user = self.show_user.lookup(phid=phid)
+            if not hit:
+                missing_phids.append(phid)
+            elif user:
+                users[phid] = user
+
+        if missing_phids:
+            params = {
+                f"constraints[phids][{i}]": phid for i, phid in enumerate(missing_phids)
+            }
+            fetched_users = {
+                user["phid"]: user for user in self._search("user.search", params)
+            }
+            # The search returned every matching user, so a phid absent from the
+            # results really doesn't match any user
+            for phid in missing_phids:
+                self.show_user.store(fetched_users.get(phid), phid=phid)
+            users |= fetched_users
+        return users
+
     @cached
     def show_projects(self, phids: list[str]) -> list[dict[str, Any]]:
         """Show details of the provided Maniphest projects"""
-        params = {}
-        for i, phid in enumerate(phids):
-            params[f"constraints[phids][{i}]"] = phid
+        params = {f"constraints[phids][{i}]": phid for i, phid in enumerate(phids)}
         return self._make_request("project.search", params=params)["result"]["data"]
 
     @cached
@@ -282,7 +376,7 @@ class PhabricatorClient:
         """Return details of the user associated with the phabricator API token"""
         return self._make_request("user.whoami")["result"]
 
-    @cached
+    @cached(ttl=timedelta(days=1))
     def find_user_by_username(self, username: str) -> Optional[dict[str, Any]]:
         """Return user details of the user with the provided username"""
         user = self._make_request(
@@ -290,6 +384,22 @@ class PhabricatorClient:
         )["result"]["data"]
         return self._first(user)
 
+    @cached(ttl=timedelta(days=1))
+    def find_users_by_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Return the details of the users with the provided usernames, indexed by
+        lower-cased username, as Phabricator matches usernames case-insensitively.
+
+        Usernames that don't match any user are absent from the returned dict.
+        """
+        params = {
+            f"constraints[usernames][{i}]": username
+            for i, username in enumerate(usernames)
+        }
+        users = self._search("user.search", params=params)
+        return {user["fields"]["username"].lower(): user for user in users}
+
     def assign_task_to_user(
         self, task_id: int, user_phid: str, secondary: bool = False
     ) -> dict[str, Any]:
@@ -364,24 +474,24 @@ class PhabricatorClient:
             project = projects[0]
         else:
             raise ValueError(f"Project {project_phid} not found")
-        if project["fields"].get("parent"):
-            parent_project_name = project["fields"]["parent"]["name"]
-            return f"{parent_project_name} ({project['fields']['name']})"
+        project_fields = project["fields"]
+        if parent := project_fields.get("parent"):
+            return f"{parent['name']} ({project_fields['name']})"
         else:
-            return project["fields"]["name"]
+            return project_fields["name"]
 
     @cached
     def find_column_in_project(self, project_phid: str, column_name: str) -> str:
         """Finds a column in a project.
 
         :raises ValueError if the column isn't found"""
-        potential_target_columns = self.list_project_columns(project_phid=project_phid)
-
-        for col in potential_target_columns:
-            if col["fields"]["name"].lower() == column_name.lower():
-                column_phid = col["phid"]
-                break
-        else:
+        # Boards can have several columns with the same name (e.g. a hidden archived
+        # column), in which case the first one wins.
+        columns_by_name = {
+            col["fields"]["name"].lower(): col["phid"]
+            for col in reversed(self.list_project_columns(project_phid=project_phid))
+        }
+        if (column_phid := columns_by_name.get(column_name.lower())) is None:
             project_name = self.format_project_name(project_phid=project_phid)
             raise ValueError(
                 f"Column {column_name} not found in milestone {project_name}"
@@ -450,13 +560,14 @@ class PhabricatorClient:
             source_phid, ignored_columns
         )
 
-        moved = []
-        for task, source_column_phid in tasks_with_columns:
+        def move_task(task_with_column: tuple[dict[str, Any], str]) -> dict[str, Any]:
+            task, source_column_phid = task_with_column
             target_column_phid = column_map[source_column_phid]
             self.assign_tag_to_task(task_id=task["id"], tag_phid=target_phid)
             self.move_task_to_column(task_id=task["id"], column_phid=target_column_phid)
-            moved.append(task)
-        return moved
+            return task
+
+        return map_concurrently(move_task, tasks_with_columns)
 
     def find_tasks_in_project_columns(
         self,
@@ -486,17 +597,17 @@ class PhabricatorClient:
         self, parent_phid: str, status: str = "all"
     ) -> list[dict[str, Any]]:
         """Return all milestones for the given parent project, ordered by milestone sequence number."""
-        milestones = self._make_request(
+        milestones = self._search(
             "project.search",
             params={
                 "constraints[isMilestone]": "true",
                 "constraints[parents][0]": parent_phid,
                 "constraints[status]": status,
             },
-        )["result"]["data"]
+        )
         return sorted(milestones, key=lambda m: m["fields"]["milestone"])
 
-    @cached
+    @cached(ttl=timedelta(days=1))
     def find_project_by_title(
         self, title: str, parent_phid: Optional[str] = None
     ) -> Optional[dict[str, Any]]:
@@ -0,0 +1,50 @@
+"""JSON (de)serialization helpers.
+
+orjson is used when it is installed, as it is several times faster than the standard
+library json module to both decode API responses and encode tasks. The standard library
+is used otherwise.
+
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """Serialize datetimes the same way orjson does, as ISO 8601 strings"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize the argument object to JSON, indented with 2 spaces if indent is True"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 if indent else None
+        ).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize the argument object to UTF-8 encoded JSON.
+
+    orjson natively produces bytes, which can be written as-is to a binary stream,
+    instead of being decoded to text only to be encoded back right away.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return dumps(obj, indent=indent).encode()
@@ -3,21 +3,21 @@ from enum import StrEnum
 import click
 
 
-class Task(int):
-    @classmethod
-    def from_str(cls, value: str) -> int:
-        return int(value.lstrip("T"))
-
-    @classmethod
-    def from_int(cls, value: int) -> str:
-        return f"T{value}"
+def parse_task_id(value: str) -> int:
+    """Return the numerical id of a task id, such as T123456 or 123456"""
+    return int(value.removeprefix("T"))
 
 
 class TaskParamType(click.ParamType):
     name = "task_id"
 
     def convert(self, value, param, ctx):
-        return Task.from_str(value)
+        if isinstance(value, int):
+            return value
+        try:
+            return parse_task_id(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a valid task id", param, ctx)
 
 
 TASK_ID = TaskParamType()
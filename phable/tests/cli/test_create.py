@@ -0,0 +1,165 @@
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from phable.cli.create import (
+    create_task,
+    resolve_owner,
+    resolve_subscribers,
+    resolve_tags,
+)
+
+
+class DummyPhabricatorClient:
+    base_url = "https://phabricator.example.org"
+
+    def __init__(self):
+        self.edits = []
+        self.lookups = []
+        self.projects = {
+            ("Data-Platform-SRE", None): {"phid": "PHID-PROJ-data-platform-sre"},
+            ("Kafka", None): {"phid": "PHID-PROJ-kafka"},
+            ("2025.03.22 - 2025.04.11", "PHID-PROJ-data-platform-sre"): {
+                "phid": "PHID-PROJ-milestone-1"
+            },
+            ("2025.04.12 - 2025.05.02", "PHID-PROJ-data-platform-sre"): {
+                "phid": "PHID-PROJ-milestone-2"
+            },
+        }
+
+        self.users = {
+            "alice": {"phid": "PHID-USER-alice"},
+            "bob": {"phid": "PHID-USER-bob"},
+        }
+
+    def find_project_by_title(self, title, parent_phid=None):
+        self.lookups.append(title)
+        return self.projects.get((title, parent_phid))
+
+    def create_or_edit_task(self, params, task_id=None):
+        self.edits.append(params)
+        return {"result": {"object": {"id": 123456, "phid": "PHID-TASK-123456"}}}
+
+    def current_user(self):
+        return self.users["alice"]
+
+    def find_user_by_username(self, username):
+        return self.users.get(username)
+
+    def find_users_by_usernames(self, usernames):
+        return {
+            username.lower(): self.users[username.lower()]
+            for username in usernames
+            if username.lower() in self.users
+        }
+
+
+def test_resolve_tags():
+    client = DummyPhabricatorClient()
+
+    assert resolve_tags(
+        client,
+        [
+            "Kafka",
+            "Data-Platform-SRE (2025.03.22 - 2025.04.11)",
+            "Data-Platform-SRE (2025.04.12 - 2025.05.02)",
+        ],
+    ) == ["PHID-PROJ-kafka", "PHID-PROJ-milestone-1", "PHID-PROJ-milestone-2"]
+    # The shared parent project is only looked up once
+    assert client.lookups.count("Data-Platform-SRE") == 1
+
+
+@pytest.mark.parametrize(
+    "tag,missing_project",
+    [
+        ("Backlog", "Backlog"),
+        ("Backlog (2025.03.22 - 2025.04.11)", "Backlog"),
+        ("Data-Platform-SRE (Backlog)", "Backlog"),
+    ],
+)
+def test_resolve_tags_not_found(tag, missing_project):
+    with pytest.raises(ValueError, match=f"Project {missing_project} not found"):
+        resolve_tags(DummyPhabricatorClient(), ["Kafka", tag])
+
+
+@pytest.mark.parametrize(
+    "owner,phid", [("bob", "PHID-USER-bob"), ("self", "PHID-USER-alice")]
+)
+def test_resolve_owner(owner, phid):
+    assert resolve_owner(DummyPhabricatorClient(), owner) == phid
+
+
+def test_resolve_owner_not_found():
+    with pytest.raises(ValueError, match="User carol not found"):
+        resolve_owner(DummyPhabricatorClient(), "carol")
+
+
+def test_resolve_subscribers():
+    assert resolve_subscribers(DummyPhabricatorClient(), ["bob", "Alice"]) == [
+        "PHID-USER-bob",
+        "PHID-USER-alice",
+    ]
+
+
+def test_resolve_subscribers_not_found():
+    with pytest.raises(ValueError, match=r"User\(s\) carol, dave not found"):
+        resolve_subscribers(DummyPhabricatorClient(), ["alice", "carol", "dave"])
+
+
+def test_create_task_prints_task_url(tmp_path, monkeypatch):
+    monkeypatch.setenv("EDITOR", "true")
+    description_filepath = tmp_path / "description.md"
+    description_filepath.write_text("Some description")
+    client = DummyPhabricatorClient()
+
+    result = CliRunner().invoke(
+        create_task,
+        [
+            "--title",
+            "A task",
+            "--description",
+            str(description_filepath),
+            "--tags",
+            "Kafka",
+            "--owner",
+            "bob",
+        ],
+        obj=client,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "https://phabricator.example.org/T123456\n"
+    assert client.edits == [
+        {
+            "title": "A task",
+            "description": "Some description",
+            "priority": "normal",
+            "projects.add": ["PHID-PROJ-kafka"],
+            "owner": "PHID-USER-bob",
+        }
+    ]
+
+
+def test_resolve_tags_limits_concurrent_lookups():
+    lock = threading.Lock()
+    in_flight, max_in_flight = 0, 0
+
+    class SlowPhabricatorClient(DummyPhabricatorClient):
+        def find_project_by_title(self, title, parent_phid=None):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return {"phid": f"PHID-PROJ-{title}"}
+
+    tags = [f"tag-{i}" for i in range(8)]
+
+    assert resolve_tags(SlowPhabricatorClient(), tags, max_workers=2) == [
+        f"PHID-PROJ-{tag}" for tag in tags
+    ]
+    assert max_in_flight == 2
@@ -0,0 +1,41 @@
+import click
+from click.testing import CliRunner
+
+from phable.cli._alias import AliasedCommandGroup
+from phable.cli.main import cli
+from phable.config import config
+
+
+def test_lazy_subcommands_resolve_to_click_commands():
+    ctx = click.Context(cli)
+    for name in cli.list_commands(ctx):
+        command = cli.get_command(ctx, name)
+        assert isinstance(command, click.Command), name
+
+
+def test_help_lists_lazy_subcommands():
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "move-project-tasks" in result.output
+    assert "Show task details" in result.output
+
+
+def test_alias_expands_to_its_target_arguments(monkeypatch):
+    monkeypatch.setattr(
+        config, "data", {"aliases": {"wip": "move --column 'In Progress'"}}
+    )
+    group = AliasedCommandGroup(name="phable")
+
+    assert group.parse_command("phable", ["wip", "T123456"]) == [
+        "phable",
+        "move",
+        "--column",
+        "In Progress",
+        "T123456",
+    ]
+    assert group.parse_command("phable", ["show", "T123456"]) == [
+        "phable",
+        "show",
+        "T123456",
+    ]
@@ -0,0 +1,45 @@
+import pytest
+from click.testing import CliRunner
+
+from phable.cli.move import move_task
+
+
+class DummyPhabricatorClient:
+    def __init__(self):
+        self.moves = []
+        self.statuses = []
+
+    def get_main_project_or_milestone(self, milestone, project_phid):
+        return "PHID-PROJ-123"
+
+    def find_column_in_project(self, project_phid, column_name):
+        return f"PHID-PCOL-{column_name}"
+
+    def move_task_to_column(self, task_id, column_phid):
+        self.moves.append((task_id, column_phid))
+
+    def mark_task_as_in_progress(self, task_id):
+        self.statuses.append((task_id, "progress"))
+
+    def mark_task_as_resolved(self, task_id):
+        self.statuses.append((task_id, "resolved"))
+
+
+@pytest.mark.parametrize(
+    "column,expected_status",
+    [("Done", "resolved"), ("In Progress", "progress"), ("Backlog", None)],
+)
+def test_move_tasks_updates_status_according_to_column(column, expected_status):
+    client = DummyPhabricatorClient()
+
+    result = CliRunner().invoke(move_task, ["T1", "T2", "--column", column], obj=client)
+
+    assert result.exit_code == 0, result.output
+    assert sorted(client.moves) == [
+        (1, f"PHID-PCOL-{column}"),
+        (2, f"PHID-PCOL-{column}"),
+    ]
+    if expected_status:
+        assert sorted(client.statuses) == [(1, expected_status), (2, expected_status)]
+    else:
+        assert client.statuses == []
@@ -1,3 +1,5 @@
+from urllib.parse import parse_qs
+
 import responses
 from click.testing import CliRunner
 
@@ -7,16 +9,45 @@ from phable.tests.cli.conftest import load_fixture, BASE_URL
 
 
 def _add_show_mocks():
-    add_response(endpoint="maniphest.search", fixture="show_task.json")
+    # The task, its subtasks and its parent are all fetched with maniphest.search,
+    # concurrently, so we match the responses on the request constraint.
+    add_response(
+        endpoint="maniphest.search",
+        fixture="show_task.json",
+        constraint="constraints[ids][0]",
+    )
     add_response(endpoint="user.search", fixture="show_user.json")
     add_response(endpoint="project.search", fixture="show_projects.json")
-    add_response(endpoint="maniphest.search", fixture="find_subtasks.json")
-    add_response(endpoint="maniphest.search", fixture="find_parent_task.json")
+    add_response(
+        endpoint="maniphest.search",
+        fixture="find_subtasks.json",
+        constraint="constraints[parentIDs][0]",
+    )
+    add_response(
+        endpoint="maniphest.search",
+        fixture="find_parent_task.json",
+        constraint="constraints[subtaskIDs][0]",
+    )
+
+
+def has_constraint(constraint: str):
+    def match(request):
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode()
+        if constraint in parse_qs(body):
+            return True, ""
+        return False, f"{constraint} not found in request body"
+
+    return match
 
 
-def add_response(endpoint: str, fixture: str):
+def add_response(endpoint: str, fixture: str, constraint: str | None = None):
     responses.add(
-        responses.POST, BASE_URL + "api/" + endpoint, json=load_fixture(fixture)
+        responses.POST,
+        BASE_URL + "api/" + endpoint,
+        json=load_fixture(fixture),
+        match=[has_constraint(constraint)] if constraint else [],
     )
 
 
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from phable.cache import cache, cached
+
+
+@pytest.fixture
+def cache_filepath(tmp_path, monkeypatch):
+    filepath = tmp_path / "cache.json"
+    monkeypatch.setattr(cache, "cache_filepath", filepath)
+    cache.clear_memory()
+    yield filepath
+    cache.clear_memory()
+
+
+def test_dump_is_skipped_when_cache_is_unmodified(cache_filepath):
+    cache.dump()
+
+    assert not cache_filepath.exists()
+
+
+def test_dump_writes_cached_values(cache_filepath):
+    @cached
+    def double(x):
+        return x * 2
+
+    double(2)
+    cache.dump()
+
+    assert json.loads(cache_filepath.read_text())["double"]["2"]["data"] == 4
+    assert not cache.dirty
+
+
+def test_cache_file_is_loaded_on_first_access(cache_filepath):
+    cache_filepath.write_text(
+        json.dumps({"double": {"2": {"data": 4, "valid_until": None}}})
+    )
+    cache.data = None
+
+    @cached
+    def double(x):
+        raise AssertionError("the cached value should have been used")
+
+    assert double(2) == 4
+
+
+def test_lookup_and_store(cache_filepath):
+    @cached
+    def find(x):
+        raise AssertionError("the stored value should have been used")
+
+    assert find.lookup(1) == (False, None)
+    find.store(None, 1)
+    assert find.lookup(1) == (True, None)
+    assert find(1) is None
@@ -0,0 +1,17 @@
+import pytest
+
+from phable.concurrency import map_concurrently
+
+
+def test_map_concurrently_preserves_order():
+    assert map_concurrently(lambda x: x * 2, range(20)) == [x * 2 for x in range(20)]
+
+
+def test_map_concurrently_reraises_exception():
+    def fail_on_odd(x: int) -> int:
+        if x % 2:
+            raise ValueError(x)
+        return x
+
+    with pytest.raises(ValueError):
+        map_concurrently(fail_on_odd, range(4))
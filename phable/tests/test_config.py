@@ -0,0 +1,51 @@
+import pytest
+
+from phable import config as phable_config
+
+
+@pytest.fixture
+def config_filepath(tmp_path, monkeypatch):
+    filepath = tmp_path / "phable" / "config.ini"
+    filepath.parent.mkdir()
+    monkeypatch.setattr(phable_config, "config_filepath", filepath)
+    phable_config.read_config.cache_clear()
+    yield filepath
+    phable_config.read_config.cache_clear()
+
+
+def test_read_config_saves_parsed_config(config_filepath):
+    config_filepath.write_text("[aliases]\ndone = move --column Done\n")
+
+    assert phable_config.read_config() == {"aliases": {"done": "move --column Done"}}
+    assert phable_config.parsed_config_filepath().exists()
+
+
+def test_read_config_uses_parsed_config_when_unchanged(config_filepath):
+    config_filepath.write_text("[aliases]\ndone = move --column Done\n")
+    phable_config.write_parsed_config(config_filepath.stat(), {"from": "cache"})
+
+    assert phable_config.read_config() == {"from": "cache"}
+
+
+def test_read_config_ignores_outdated_parsed_config(config_filepath):
+    config_filepath.write_text("[aliases]\ndone = move --column Done\n")
+    phable_config.write_parsed_config(config_filepath.stat(), {"from": "cache"})
+    config_filepath.write_text("[aliases]\nwip = move --column 'In Progress'\n")
+
+    assert phable_config.read_config() == {
+        "aliases": {"wip": "move --column 'In Progress'"}
+    }
+
+
+def test_write_parsed_config_removes_temporary_file_on_failure(
+    config_filepath, monkeypatch
+):
+    config_filepath.write_text("[phabricator]\ntoken = secret\n")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(phable_config.os, "replace", failing_replace)
+    phable_config.write_parsed_config(config_filepath.stat(), {"token": "secret"})
+
+    assert list(config_filepath.parent.iterdir()) == [config_filepath]
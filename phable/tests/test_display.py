@@ -0,0 +1,37 @@
+import json
+
+from phable.display import JsonTaskPrinter, TaskFormat, display_task, display_tasks
+
+
+def test_display_task_json(capsys):
+    task = {"id": 123456, "fields": {"name": "A task"}}
+
+    display_task(task, format=TaskFormat.json)
+
+    assert json.loads(capsys.readouterr().out) == task
+
+
+def test_display_tasks_json(capsys):
+    tasks = [{"id": 123456}, {"id": 123457}]
+
+    display_tasks(tasks, format=TaskFormat.json)
+
+    assert json.loads(capsys.readouterr().out) == tasks
+
+
+def test_display_tasks_json_with_single_task(capsys):
+    tasks = [{"id": 123456}]
+
+    display_tasks(tasks, format=TaskFormat.json)
+
+    assert json.loads(capsys.readouterr().out) == tasks
+
+
+def test_json_task_printer_writes_bytes_to_its_printer():
+    written = []
+    task = {"id": 123456}
+
+    JsonTaskPrinter(written.append).print(task)
+
+    assert len(written) == 1
+    assert json.loads(written[0]) == task
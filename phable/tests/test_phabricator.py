@@ -1,4 +1,5 @@
 import json
+import time
 from urllib.parse import parse_qs
 
 import responses
@@ -377,3 +378,266 @@ def test_find_milestones_for_project(milestones_response):
     assert milestones[0]["phid"] == "PHID-PROJ-milestone1"
     assert milestones[2]["phid"] == "PHID-PROJ-milestone3"
     assert milestones[2]["fields"]["status"] == "active"
+
+
+@responses.activate
+def test_find_users_by_usernames():
+    captured_request = {}
+
+    def callback(request):
+        captured_request["body"] = request.body
+        users = [
+            {"phid": f"PHID-USER-{username}", "fields": {"username": username}}
+            for username in ("alice", "bob")
+        ]
+        return (200, {}, json.dumps({"result": {"data": users}, "error_code": None}))
+
+    responses.add_callback(
+        responses.POST,
+        base_url + "api/user.search",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    client = PhabricatorClient(base_url, token)
+    users = client.find_users_by_usernames(["alice", "Bob", "unknown"])
+
+    request_body = captured_request["body"]
+    if isinstance(request_body, bytes):
+        request_body = request_body.decode()
+    payload = parse_qs(request_body)
+
+    assert len(responses.calls) == 1
+    assert payload["constraints[usernames][0]"] == ["alice"]
+    assert payload["constraints[usernames][1]"] == ["Bob"]
+    assert payload["constraints[usernames][2]"] == ["unknown"]
+    assert users["alice"]["phid"] == "PHID-USER-alice"
+    assert users["bob"]["phid"] == "PHID-USER-bob"
+    assert "unknown" not in users
+
+
+@responses.activate
+def test_show_users():
+    captured_request = {}
+
+    def callback(request):
+        captured_request["body"] = request.body
+        users = [
+            {"phid": f"PHID-USER-{username}", "fields": {"username": username}}
+            for username in ("alice", "bob")
+        ]
+        return (200, {}, json.dumps({"result": {"data": users}, "error_code": None}))
+
+    responses.add_callback(
+        responses.POST,
+        base_url + "api/user.search",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    client = PhabricatorClient(base_url, token)
+    users = client.show_users(["PHID-USER-alice", "PHID-USER-bob"])
+
+    request_body = captured_request["body"]
+    if isinstance(request_body, bytes):
+        request_body = request_body.decode()
+    payload = parse_qs(request_body)
+
+    assert len(responses.calls) == 1
+    assert payload["constraints[phids][0]"] == ["PHID-USER-alice"]
+    assert payload["constraints[phids][1]"] == ["PHID-USER-bob"]
+    assert users["PHID-USER-alice"]["fields"]["username"] == "alice"
+    assert users["PHID-USER-bob"]["fields"]["username"] == "bob"
+
+
+@responses.activate
+def test_make_request_retries_rate_limited_requests(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    responses.add(responses.POST, base_url + "api/user.whoami", status=429)
+    responses.add(
+        responses.POST,
+        base_url + "api/user.whoami",
+        json={"result": {"userName": "alice"}, "error_code": None},
+    )
+
+    client = PhabricatorClient(base_url, token)
+
+    assert client._make_request("user.whoami")["result"]["userName"] == "alice"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_find_subtasks_follows_result_pages():
+    def page(task_ids, after):
+        return {
+            "result": {
+                "data": [{"id": task_id} for task_id in task_ids],
+                "cursor": {"limit": 2, "after": after, "before": None, "order": None},
+            },
+            "error_code": None,
+        }
+
+    def callback(request):
+        request_body = request.body
+        if isinstance(request_body, bytes):
+            request_body = request_body.decode()
+        if parse_qs(request_body).get("after") == ["2"]:
+            return (200, {}, json.dumps(page([3], after=None)))
+        return (200, {}, json.dumps(page([1, 2], after="2")))
+
+    responses.add_callback(
+        responses.POST,
+        base_url + "api/maniphest.search",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    client = PhabricatorClient(base_url, token)
+
+    assert [task["id"] for task in client.find_subtasks(parent_id=1)] == [1, 2, 3]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_enrich_task_with_comments_resolves_authors_at_once():
+    def comment(author, text):
+        return {
+            "authorPHID": f"PHID-USER-{author}",
+            "content": {"raw": text},
+            "dateModified": 1700000000,
+            "removed": False,
+        }
+
+    responses.add(
+        responses.POST,
+        base_url + "api/transaction.search",
+        json={
+            "result": {
+                "data": [
+                    {"comments": [comment("carol", "first")]},
+                    {"comments": [comment("dave", "second")]},
+                    {"comments": [comment("carol", "third")]},
+                ]
+            },
+            "error_code": None,
+        },
+    )
+    responses.add(
+        responses.POST,
+        base_url + "api/user.search",
+        json={
+            "result": {
+                "data": [
+                    {"phid": f"PHID-USER-{username}", "fields": {"username": username}}
+                    for username in ("carol", "dave")
+                ]
+            },
+            "error_code": None,
+        },
+    )
+
+    client = PhabricatorClient(base_url, token)
+    task = {"id": 1}
+    client.enrich_task_with_comments(task)
+
+    assert [(c["author"], c["comment"]) for c in task["comments"]] == [
+        ("carol", "first"),
+        ("dave", "second"),
+        ("carol", "third"),
+    ]
+    assert len(responses.calls) == 2
+
+
+def test_find_column_in_project_returns_first_column_with_name():
+    client = PhabricatorClient(base_url, token)
+    client.list_project_columns = lambda project_phid: [
+        {"phid": "PHID-PCOL-backlog", "fields": {"name": "Backlog"}},
+        {"phid": "PHID-PCOL-visible", "fields": {"name": "Done"}},
+        {"phid": "PHID-PCOL-hidden", "fields": {"name": "done"}},
+    ]
+
+    assert (
+        client.find_column_in_project("PHID-PROJ-duplicate-columns", "DONE")
+        == "PHID-PCOL-visible"
+    )
+
+
+@responses.activate
+def test_show_users_only_requests_uncached_users():
+    requested_phids = []
+
+    def callback(request):
+        request_body = request.body
+        if isinstance(request_body, bytes):
+            request_body = request_body.decode()
+        phids = [
+            values[0]
+            for key, values in parse_qs(request_body).items()
+            if key.startswith("constraints[phids]")
+        ]
+        requested_phids.append(phids)
+        users = [
+            {"phid": phid, "fields": {"username": phid.removeprefix("PHID-USER-")}}
+            for phid in phids
+            if phid != "PHID-USER-unknown"
+        ]
+        return (200, {}, json.dumps({"result": {"data": users}, "error_code": None}))
+
+    responses.add_callback(
+        responses.POST,
+        base_url + "api/user.search",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    client = PhabricatorClient(base_url, token)
+    client.show_users(["PHID-USER-erin"])
+    users = client.show_users(
+        ["PHID-USER-erin", "PHID-USER-frank", "PHID-USER-unknown"]
+    )
+    client.show_users(["PHID-USER-frank", "PHID-USER-unknown"])
+
+    assert requested_phids == [
+        ["PHID-USER-erin"],
+        ["PHID-USER-frank", "PHID-USER-unknown"],
+    ]
+    assert set(users) == {"PHID-USER-erin", "PHID-USER-frank"}
+    assert client.show_user(phid="PHID-USER-frank")["fields"]["username"] == "frank"
+
+
+@responses.activate
+def test_show_users_follows_result_pages():
+    def page(usernames, after):
+        return {
+            "result": {
+                "data": [
+                    {"phid": f"PHID-USER-{username}", "fields": {"username": username}}
+                    for username in usernames
+                ],
+                "cursor": {"limit": 1, "after": after, "before": None, "order": None},
+            },
+            "error_code": None,
+        }
+
+    def callback(request):
+        request_body = request.body
+        if isinstance(request_body, bytes):
+            request_body = request_body.decode()
+        if parse_qs(request_body).get("after") == ["1"]:
+            return (200, {}, json.dumps(page(["heidi"], after=None)))
+        return (200, {}, json.dumps(page(["grace"], after="1")))
+
+    responses.add_callback(
+        responses.POST,
+        base_url + "api/user.search",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    client = PhabricatorClient(base_url, token)
+    users = client.show_users(["PHID-USER-grace", "PHID-USER-heidi"])
+
+    assert set(users) == {"PHID-USER-grace", "PHID-USER-heidi"}
+    assert len(responses.calls) == 2
+    assert client.show_user(phid="PHID-USER-heidi")["fields"]["username"] == "heidi"
+    assert len(responses.calls) == 2
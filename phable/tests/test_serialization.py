@@ -0,0 +1,35 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from phable import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_dumps_indented_matches_stdlib(json_backend):
+    task = {"id": 123456, "fields": {"name": "A task", "points": None}}
+
+    assert serialization.dumps(task, indent=True) == json.dumps(task, indent=2)
+
+
+def test_loads_roundtrip(json_backend):
+    task = {"id": 123456, "fields": {"name": "A task", "points": None}}
+
+    assert serialization.loads(serialization.dumps(task).encode()) == task
+
+
+def test_dumps_datetimes_as_iso_8601(json_backend):
+    comment = {"modified": datetime(2025, 3, 22, 10, 30, tzinfo=UTC)}
+
+    assert serialization.loads(serialization.dumps(comment)) == {
+        "modified": "2025-03-22T10:30:00+00:00"
+    }
@@ -0,0 +1,14 @@
+import click
+import pytest
+
+from phable.task import TASK_ID, parse_task_id
+
+
+@pytest.mark.parametrize("value,expected", [("T123456", 123456), ("123456", 123456)])
+def test_parse_task_id(value, expected):
+    assert parse_task_id(value) == expected
+
+
+def test_task_param_type_rejects_invalid_task_id():
+    with pytest.raises(click.BadParameter):
+        TASK_ID.convert("TT123", None, None)
@@ -2,7 +2,7 @@ from pathlib import Path
 from unittest import mock
 
 
-from phable.utils import text_from_cli_arg_or_fs_or_editor
+from phable.utils import is_existing_path, text_from_cli_arg_or_fs_or_editor
 
 
 def test_text_from_cli_arg_or_fs_or_editor_with_noting(monkeypatch):
@@ -32,3 +32,30 @@ def test_from_cli_arg_or_fs_or_editor_with_path_and_force_editor(tmpdir, monkeyp
             == "some text"
         )
         m_sub_run.assert_called_once_with(["vim", str(tmpfile)])
+
+
+def test_is_existing_path(tmpdir):
+    tmpfile: Path = tmpdir / "description.txt"
+    tmpfile.write_text("some text", encoding="utf-8")
+    assert is_existing_path(str(tmpfile))
+    assert not is_existing_path(str(tmpdir / "missing.txt"))
+
+
+def test_is_existing_path_with_free_text():
+    assert not is_existing_path("first line\nsecond line")
+    assert not is_existing_path("a" * 5000)
+    assert not is_existing_path("a" * 300)
+
+
+def test_text_from_cli_arg_or_fs_or_editor_returns_editor_text(monkeypatch):
+    monkeypatch.setenv("EDITOR", "vim")
+    edited_paths = []
+
+    def edit(args):
+        path = Path(args[1])
+        path.write_text("some text", encoding="utf-8")
+        edited_paths.append(path)
+
+    with mock.patch("phable.utils.subprocess.run", side_effect=edit):
+        assert text_from_cli_arg_or_fs_or_editor() == "some text"
+    assert not edited_paths[0].exists()
@@ -22,11 +22,17 @@ def text_from_cli_arg_or_fs_or_editor(
     """
     editor = find_editor()
     if not (body or path):
-        txt_tmpfile = tempfile.NamedTemporaryFile(
-            encoding="utf-8", mode="w", suffix=".md"
-        )
-        subprocess.run([editor, txt_tmpfile.name])
-        return Path(txt_tmpfile.name).read_text(encoding="utf-8")
+        # The file is closed before the editor is started, as some editors replace the
+        # file instead of writing to it, and some platforms don't allow the file to be
+        # opened twice. We then read it once and delete it ourselves.
+        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as txt_tmpfile:
+            pass
+        txt_path = Path(txt_tmpfile.name)
+        try:
+            subprocess.run([editor, txt_path])
+            return txt_path.read_text(encoding="utf-8")
+        finally:
+            txt_path.unlink(missing_ok=True)
 
     if body:
         return body
@@ -42,6 +48,22 @@ def text_from_cli_arg_or_fs_or_editor(
     return path.read_text(encoding="utf-8")
 
 
+def is_existing_path(text: str) -> bool:
+    """Return whether the argument text is the path of an existing file.
+
+    Text that can't possibly be a path (too long, or spanning multiple lines) is rejected
+    without probing the filesystem.
+
+    """
+    if len(text) >= 4096 or "\n" in text or "\0" in text:
+        return False
+    try:
+        return Path(text).exists()
+    except OSError:
+        # e.g. a path component longer than the filesystem allows
+        return False
+
+
 def find_editor() -> str:
     """
     Try and find a suitable editor for editing text.